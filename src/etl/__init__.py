@@ -2,8 +2,14 @@
 ETL package for property data normalization and loading.
 """
 
-from .extract import load_properties_from_json
-from .transform import transform_properties
+from .extract import load_properties_from_json, iter_properties_from_json
+from .transform import transform_properties, iter_fact_batches
 from .load import load_to_database
 
-__all__ = ["load_properties_from_json", "transform_properties", "load_to_database"]
+__all__ = [
+    "load_properties_from_json",
+    "iter_properties_from_json",
+    "transform_properties",
+    "iter_fact_batches",
+    "load_to_database",
+]
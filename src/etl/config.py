@@ -34,6 +34,9 @@ class ETLConfig:
     BATCH_SIZE = int(os.getenv("BATCH_SIZE", "1000"))
     MAX_RECORDS = int(os.getenv("MAX_RECORDS", "0"))  # 0 = no limit
     SKIP_INVALID = os.getenv("SKIP_INVALID", "true").lower() == "true"
+    WORKERS = int(os.getenv("WORKERS", "1"))  # 1 = validate in-process, 0 = one per CPU
+    # Below this many records a process pool costs more to start than it saves
+    PARALLEL_MIN_RECORDS = int(os.getenv("PARALLEL_MIN_RECORDS", "5000"))
     
     @classmethod
     def to_dict(cls):
@@ -43,5 +46,7 @@ class ETLConfig:
             "log_level": cls.LOG_LEVEL,
             "batch_size": cls.BATCH_SIZE,
             "max_records": cls.MAX_RECORDS,
-            "skip_invalid": cls.SKIP_INVALID
+            "skip_invalid": cls.SKIP_INVALID,
+            "workers": cls.WORKERS,
+            "parallel_min_records": cls.PARALLEL_MIN_RECORDS
         }
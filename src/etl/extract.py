@@ -1,37 +1,115 @@
 """Extract module: Load and validate JSON property data using Pydantic."""
 
+import io
 import json
 import logging
+import os
+import re
+import ijson
+import orjson
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Iterator, Iterable
 from pydantic import ValidationError
 
-from src.models import Property
+from src.models import Property, preprocess_row
+from src.etl.config import ETLConfig
 from src.etl.preprocess import load_and_preprocess_json
 
 logger = logging.getLogger(__name__)
 
+# Records validated per task; validated properties are released downstream per chunk
+VALIDATION_CHUNK_SIZE = 1000
 
-def load_properties_from_json(
+_TOP_LEVEL_ARRAY = re.compile(rb'\s*\[')
+
+
+def _validate_chunk(
+    raw_records: List[Dict[str, Any]],
+    start_index: int = 1
+) -> Tuple[List[Property], List[Dict[str, Any]]]:
+    """Validate a contiguous slice of raw records; runs in worker processes."""
+    valid_properties = []
+    invalid_records = []
+    
+    for idx, raw_record in enumerate(raw_records, start_index):
+        try:
+            valid_properties.append(Property.model_validate(preprocess_row(raw_record)))
+        except ValidationError as e:
+            invalid_records.append({
+                "record_index": idx,
+                "raw_record": raw_record,
+                "errors": e.errors()
+            })
+    
+    return valid_properties, invalid_records
+
+
+def _iter_chunks(raw_records: Iterable[Dict[str, Any]]) -> Iterator[Tuple[List[Dict[str, Any]], int]]:
+    """Group raw records into validation chunks paired with their 1-based start index."""
+    raw_records = iter(raw_records)
+    start_index = 1
+    while True:
+        chunk = list(islice(raw_records, VALIDATION_CHUNK_SIZE))
+        if not chunk:
+            return
+        yield chunk, start_index
+        start_index += len(chunk)
+
+
+def _iter_validation_results(
+    raw_records: Iterable[Dict[str, Any]],
+    workers: int
+) -> Iterator[Tuple[List[Property], List[Dict[str, Any]]]]:
+    """Validate raw records chunk by chunk, yielding results in input order."""
+    raw_records = iter(raw_records)
+    head = list(islice(raw_records, ETLConfig.PARALLEL_MIN_RECORDS))
+    chunks = _iter_chunks(chain(head, raw_records))
+    
+    if workers > 1 and len(head) >= ETLConfig.PARALLEL_MIN_RECORDS:
+        logger.info(f"Validating in {workers} worker processes")
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            # Submit a bounded window rather than executor.map, which would drain the whole stream
+            pending = deque()
+            for chunk, start_index in chunks:
+                pending.append(executor.submit(_validate_chunk, chunk, start_index))
+                if len(pending) > workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+    else:
+        for chunk, start_index in chunks:
+            yield _validate_chunk(chunk, start_index)
+
+
+def iter_properties_from_json(
     json_file_path: str,
     max_records: int = None,
-    skip_invalid: bool = True
-) -> Tuple[List[Property], List[Dict[str, Any]]]:
-    """Load and validate properties from JSON file."""
+    skip_invalid: bool = True,
+    workers: int = 1,
+    invalid_records: List[Dict[str, Any]] = None
+) -> Iterator[Property]:
+    """Stream validated properties from JSON file; invalid records are appended to invalid_records."""
     json_file_path = Path(json_file_path)
     
     if not json_file_path.exists():
         raise FileNotFoundError(f"JSON file not found: {json_file_path}")
     
-    valid_properties = []
-    invalid_records = []
+    if invalid_records is None:
+        invalid_records = []
+    valid_count = 0
     
     logger.info(f"Starting to load properties from {json_file_path}")
     
     # Preprocess JSON (repair common errors)
     logger.info("Step 1: Preprocessing JSON (repairing common syntax errors)...")
     try:
-        cleaned_json_str, preprocess_summary = load_and_preprocess_json(json_file_path)
+        cleaned_json, preprocess_summary = load_and_preprocess_json(json_file_path)
         logger.info(f"Preprocessing complete: {preprocess_summary['fixes_count']} repairs applied")
     except Exception as e:
         logger.error(f"Preprocessing failed: {e}")
@@ -39,41 +117,64 @@ def load_properties_from_json(
     
     # Parse preprocessed JSON
     logger.info("Step 2: Parsing cleaned JSON...")
-    try:
-        raw_data = json.loads(cleaned_json_str)
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse JSON after preprocessing: {e}")
-        raise
+    if not preprocess_summary["success"]:
+        try:
+            orjson.loads(cleaned_json)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON after preprocessing: {e}")
+            raise
     
-    if not isinstance(raw_data, list):
-        raw_data = [raw_data]
+    if _TOP_LEVEL_ARRAY.match(cleaned_json):
+        # Preprocessing has already confirmed the document is valid, so records can be
+        # parsed one at a time instead of materializing the whole array
+        raw_records = ijson.items(io.BytesIO(cleaned_json), "item", use_float=True)
+    else:
+        raw_records = iter([orjson.loads(cleaned_json)])
+    del cleaned_json
     
-    total_records = len(raw_data)
     if max_records:
-        raw_data = raw_data[:max_records]
-        logger.info(f"Processing first {max_records} of {total_records} records")
+        raw_records = islice(raw_records, max_records)
+        logger.info(f"Processing first {max_records} records")
     else:
-        logger.info(f"Processing all {total_records} records")
-    
-    for idx, raw_record in enumerate(raw_data, 1):
-        try:
-            validated_property = Property.model_validate(raw_record)
-            valid_properties.append(validated_property)
-            
-            if idx % 100 == 0:
-                logger.debug(f"Processed {idx} records successfully")
-                
-        except ValidationError as e:
-            logger.warning(f"Validation error at record {idx}: {e.error_count()} error(s)")
-            invalid_records.append({
-                "record_index": idx,
-                "raw_record": raw_record,
-                "errors": e.errors()
-            })
-            
-            if not skip_invalid:
-                raise
+        logger.info("Processing all records")
     
-    logger.info(f"Load complete: {len(valid_properties)} valid, {len(invalid_records)} invalid")
+    workers = workers or os.cpu_count() or 1
+    for chunk_valid, chunk_invalid in _iter_validation_results(raw_records, workers):
+        for invalid in chunk_invalid:
+            logger.warning(
+                f"Validation error at record {invalid['record_index']}: {len(invalid['errors'])} error(s)"
+            )
+        
+        if chunk_invalid and not skip_invalid:
+            invalid_records.extend(chunk_invalid)
+            # Re-validate the failure to raise its original ValidationError
+            Property.model_validate(chunk_invalid[0]["raw_record"])
+        
+        # Keep only the error metadata so skipped records don't accumulate in memory
+        invalid_records.extend(
+            {"record_index": invalid["record_index"], "errors": invalid["errors"]}
+            for invalid in chunk_invalid
+        )
+        
+        valid_count += len(chunk_valid)
+        yield from chunk_valid
     
+    logger.info(f"Load complete: {valid_count} valid, {len(invalid_records)} invalid")
+
+
+def load_properties_from_json(
+    json_file_path: str,
+    max_records: int = None,
+    skip_invalid: bool = True,
+    workers: int = 1
+) -> Tuple[List[Property], List[Dict[str, Any]]]:
+    """Load and validate properties from JSON file."""
+    invalid_records = []
+    valid_properties = list(iter_properties_from_json(
+        json_file_path,
+        max_records=max_records,
+        skip_invalid=skip_invalid,
+        workers=workers,
+        invalid_records=invalid_records
+    ))
     return valid_properties, invalid_records
@@ -1,48 +1,123 @@
 """Load module: Insert transformed data into MySQL database."""
 
 import logging
-from typing import List, Dict, Any
-import mysql.connector
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import List, Dict, Any, Tuple, Iterable, Union
 from mysql.connector import Error as MySQLError
+from mysql.connector import DataError
+from mysql.connector import errorcode
+from mysql.connector.pooling import MySQLConnectionPool
+
+from src.etl.transform import PROPERTY_COLUMNS, VALUATION_COLUMNS, HOA_COLUMNS, REHAB_COLUMNS
 
 logger = logging.getLogger(__name__)
 
 
+# Connections kept open per set of connection settings
+POOL_SIZE = 5
+
+# Load order: parents before the tables referencing them
+FACT_TABLES = ("properties", "valuations", "hoa_fees", "rehab_assessments")
+
+# Errors raised when the client or server refuses LOAD DATA LOCAL INFILE
+LOCAL_INFILE_DISABLED_ERRNOS = frozenset({
+    errorcode.ER_NOT_ALLOWED_COMMAND,
+    errorcode.ER_CLIENT_LOCAL_FILES_DISABLED,
+    errorcode.CR_LOAD_DATA_LOCAL_INFILE_REJECTED,
+})
+
+# Servers, as (host, port), that refused LOAD DATA LOCAL INFILE; shared by every loader so
+# parallel connections don't each retry and warn
+_LOCAL_INFILE_REFUSED = set()
+
+_INFILE_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\0": "\\0"})
+
+
+def _to_infile_field(value: Any) -> str:
+    """Render a value in LOAD DATA's default escaped text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, str):
+        return value.translate(_INFILE_ESCAPES)
+    return str(value)
+
+
+@lru_cache(maxsize=None)
+def get_connection_pool(host: str, port: int, user: str, password: str, database: str) -> MySQLConnectionPool:
+    """Return the process-wide connection pool for these settings, creating it on first use."""
+    return MySQLConnectionPool(
+        pool_name="etl",
+        pool_size=POOL_SIZE,
+        host=host,
+        port=port,
+        user=user,
+        password=password,
+        database=database,
+        # Serve LOCAL INFILE requests only from the directory bulk_load_csv writes to, so a
+        # rogue server cannot read arbitrary files from this host
+        allow_local_infile_in_path=tempfile.gettempdir()
+    )
+
+
+@lru_cache(maxsize=32)
+def _multi_row_insert_sql(table: str, columns: Tuple[str, ...], row_count: int) -> str:
+    """Build an INSERT with one positional VALUES group per row."""
+    group = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES " + ", ".join([group] * row_count)
+
+
 class DatabaseLoader:
     """Manages database connections and loading operations."""
     
-    def __init__(self, host: str, user: str, password: str, database: str, port: int = 3306):
+    def __init__(self, host: str, user: str, password: str, database: str, port: int = 3306,
+                 batch_size: int = 1000):
         self.host = host
         self.user = user
         self.password = password
         self.database = database
         self.port = port
+        self.batch_size = batch_size
+        self.dropped_indexes = []
         self.connection = None
         self.cursor = None
     
+    @property
+    def use_local_infile(self) -> bool:
+        """Whether to try LOAD DATA LOCAL INFILE against this server."""
+        return (self.host, self.port) not in _LOCAL_INFILE_REFUSED
+    
     def connect(self):
-        """Establish database connection."""
+        """Check out a connection from the shared pool."""
         try:
-            self.connection = mysql.connector.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                database=self.database,
-                port=self.port
-            )
+            pool = get_connection_pool(self.host, self.port, self.user, self.password, self.database)
+            self.connection = pool.get_connection()
             self.cursor = self.connection.cursor()
+            # Pooled sessions are reset on return, so autocommit must be disabled per checkout
+            self.cursor.execute("SET autocommit = 0")
             logger.info(f"Connected to MySQL database: {self.database}")
         except MySQLError as e:
             logger.error(f"Failed to connect to database: {e}")
+            # Return a checked-out connection so failed setups don't drain the pool
+            if self.connection:
+                try:
+                    self.connection.close()
+                except MySQLError:
+                    pass
+                self.connection = None
+                self.cursor = None
             raise
     
     def disconnect(self):
-        """Close database connection."""
+        """Return the connection to the pool."""
         if self.cursor:
             self.cursor.close()
         if self.connection:
             self.connection.close()
-            logger.info("Database connection closed")
+            logger.info("Database connection returned to pool")
     
     def execute_sql_file(self, sql_file_path: str):
         """Execute SQL commands from file."""
@@ -50,25 +125,11 @@ class DatabaseLoader:
             with open(sql_file_path, "r", encoding="utf-8") as f:
                 sql_content = f.read()
             
-            # Remove SQL comments
-            lines = sql_content.split('\n')
-            cleaned_lines = []
-            for line in lines:
-                if '--' in line:
-                    line = line[:line.index('--')]
-                cleaned_lines.append(line)
-            sql_content = '\n'.join(cleaned_lines)
-            
-            statements = sql_content.split(";")
-            for statement in statements:
-                statement = statement.strip()
-                if statement:
-                    logger.debug(f"Executing: {statement[:100]}...")
-                    self.cursor.execute(statement)
-                    try:
-                        self.cursor.fetchall()
-                    except:
-                        pass
+            # Send the whole script in one round trip; the server handles comments and splitting
+            for result in self.cursor.execute(sql_content, multi=True):
+                logger.debug(f"Executed: {result.statement[:100]}...")
+                if result.with_rows:
+                    result.fetchall()
             
             self.connection.commit()
             logger.info(f"Successfully executed SQL from {sql_file_path}")
@@ -77,96 +138,150 @@ class DatabaseLoader:
             self.connection.rollback()
             raise
     
-    def load_properties(self, property_rows: List[Dict[str, Any]]):
-        insert_sql = """
-        INSERT INTO properties (
-            property_title, address, street_address, city, state, zip_code,
-            latitude, longitude, property_type, year_built, sqft_total,
-            sqft_basement, sqft_mu, bed, bath, layout, pool, parking,
-            basement_yes_no, water, sewage, htw, commercial, highway, train,
-            flood, occupancy, net_yield, irr, taxes, tax_rate, market, source,
-            neighborhood_rating, school_average, subdivision, reviewed_status,
-            most_recent_status, selling_reason, final_reviewer,
-            seller_retained_broker, rent_restricted
-        ) VALUES (
-            %(property_title)s, %(address)s, %(street_address)s, %(city)s,
-            %(state)s, %(zip_code)s, %(latitude)s, %(longitude)s,
-            %(property_type)s, %(year_built)s, %(sqft_total)s, %(sqft_basement)s,
-            %(sqft_mu)s, %(bed)s, %(bath)s, %(layout)s, %(pool)s, %(parking)s,
-            %(basement_yes_no)s, %(water)s, %(sewage)s, %(htw)s, %(commercial)s,
-            %(highway)s, %(train)s, %(flood)s, %(occupancy)s, %(net_yield)s,
-            %(irr)s, %(taxes)s, %(tax_rate)s, %(market)s, %(source)s,
-            %(neighborhood_rating)s, %(school_average)s, %(subdivision)s,
-            %(reviewed_status)s, %(most_recent_status)s, %(selling_reason)s,
-            %(final_reviewer)s, %(seller_retained_broker)s, %(rent_restricted)s
+    def begin_bulk_load(self):
+        """Relax per-row constraint checks for the current session; the pool resets them on return."""
+        self.cursor.execute("SET unique_checks = 0")
+        self.cursor.execute("SET foreign_key_checks = 0")
+    
+    def disable_indexes_for_bulk(self, tables: Tuple[str, ...]):
+        """Drop non-unique secondary indexes on tables, remembering them for restore_indexes()."""
+        # InnoDB ignores DISABLE KEYS, so indexes are dropped outright. Indexes led by a
+        # foreign-key column cannot be dropped. DDL commits implicitly: call outside the load transaction.
+        placeholders = ", ".join(["%s"] * len(tables))
+        self.cursor.execute(
+            f"SELECT TABLE_NAME, COLUMN_NAME FROM information_schema.KEY_COLUMN_USAGE "
+            f"WHERE TABLE_SCHEMA = DATABASE() AND REFERENCED_TABLE_NAME IS NOT NULL "
+            f"AND ORDINAL_POSITION = 1 AND TABLE_NAME IN ({placeholders})",
+            tables
         )
-        """
+        fk_columns = set(self.cursor.fetchall())
+        
+        self.cursor.execute(
+            f"SELECT TABLE_NAME, INDEX_NAME, COLUMN_NAME, SUB_PART, COLLATION "
+            f"FROM information_schema.STATISTICS "
+            f"WHERE TABLE_SCHEMA = DATABASE() AND NON_UNIQUE = 1 AND INDEX_TYPE = 'BTREE' "
+            f"AND TABLE_NAME IN ({placeholders}) "
+            f"ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX",
+            tables
+        )
+        indexes = {}
+        for table, index, column, sub_part, collation in self.cursor.fetchall():
+            indexes.setdefault((table, index), []).append((column, sub_part, collation))
+        
+        for (table, index), parts in indexes.items():
+            leading_column = parts[0][0]
+            if (table, leading_column) in fk_columns or any(column is None for column, _, _ in parts):
+                continue
+            columns_sql = ", ".join(
+                f"`{column}`" + (f"({sub_part})" if sub_part else "") + (" DESC" if collation == "D" else "")
+                for column, sub_part, collation in parts
+            )
+            self.cursor.execute(f"ALTER TABLE `{table}` DROP INDEX `{index}`")
+            self.dropped_indexes.append((table, index, columns_sql))
+        
+        if self.dropped_indexes:
+            logger.info(f"Dropped {len(self.dropped_indexes)} secondary indexes for bulk load")
+    
+    def restore_indexes(self):
+        """Rebuild the indexes dropped by disable_indexes_for_bulk(), one ALTER per table."""
+        by_table = {}
+        for table, index, columns_sql in self.dropped_indexes:
+            by_table.setdefault(table, []).append(f"ADD INDEX `{index}` ({columns_sql})")
+        
+        for table, clauses in by_table.items():
+            self.cursor.execute(f"ALTER TABLE `{table}` {', '.join(clauses)}")
+        
+        if self.dropped_indexes:
+            logger.info(f"Rebuilt {len(self.dropped_indexes)} secondary indexes")
+        self.dropped_indexes = []
+    
+    def _insert_rows(self, table: str, columns: Tuple[str, ...], rows: List[Tuple[Any, ...]]) -> int:
+        """Insert rows as multi-row INSERT statements, one round trip per batch."""
+        inserted = 0
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows[start:start + self.batch_size]
+            params = list(chain.from_iterable(batch))
+            self.cursor.execute(_multi_row_insert_sql(table, columns, len(batch)), params)
+            inserted += self.cursor.rowcount
+        return inserted
+    
+    def bulk_load_csv(self, table: str, columns: Tuple[str, ...], rows: List[Tuple[Any, ...]]) -> int:
+        """Stream rows to a temporary tab-separated file and ingest it with LOAD DATA LOCAL INFILE."""
+        fd, path = tempfile.mkstemp(prefix=f"{table}_", suffix=".tsv")
         try:
-            self.cursor.executemany(insert_sql, property_rows)
-            self.connection.commit()
-            logger.info(f"Inserted {self.cursor.rowcount} properties")
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                for row in rows:
+                    f.write("\t".join(map(_to_infile_field, row)))
+                    f.write("\n")
+            
+            self.cursor.execute(
+                f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE {table} "
+                f"CHARACTER SET utf8mb4 "
+                f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+                f"LINES TERMINATED BY '\\n' "
+                f"({', '.join(columns)})"
+            )
+            # LOCAL implies IGNORE: duplicate keys and bad values only raise warnings while the
+            # row is skipped or truncated, so any warning or shortfall fails the load
+            loaded = self.cursor.rowcount
+            warning_count = self.cursor.warning_count
+            if warning_count or loaded != len(rows):
+                self.cursor.execute("SHOW WARNINGS LIMIT 5")
+                details = "; ".join(str(message) for _, _, message in self.cursor.fetchall())
+                raise DataError(
+                    f"LOAD DATA into {table} loaded {loaded} of {len(rows)} rows "
+                    f"with {warning_count} warning(s): {details}"
+                )
+            return loaded
+        finally:
+            os.remove(path)
+    
+    def _load_table(self, table: str, columns: Tuple[str, ...], rows: List[Tuple[Any, ...]]) -> int:
+        """Load rows via LOCAL INFILE, falling back to multi-row INSERTs if it is refused."""
+        if self.use_local_infile:
+            try:
+                return self.bulk_load_csv(table, columns, rows)
+            except MySQLError as e:
+                if e.errno not in LOCAL_INFILE_DISABLED_ERRNOS:
+                    raise
+                logger.warning(f"LOAD DATA LOCAL INFILE unavailable ({e}), falling back to INSERT")
+                _LOCAL_INFILE_REFUSED.add((self.host, self.port))
+        return self._insert_rows(table, columns, rows)
+    
+    def load_properties(self, property_rows: List[Tuple[Any, ...]]):
+        try:
+            inserted = self._load_table("properties", PROPERTY_COLUMNS, property_rows)
+            logger.debug(f"Inserted {inserted} properties")
+            return inserted
         except MySQLError as e:
             logger.error(f"Failed to insert properties: {e}")
-            self.connection.rollback()
             raise
     
-    def load_valuations(self, valuation_rows: List[Dict[str, Any]]):
-        insert_sql = """
-        INSERT INTO valuations (
-            property_id, valuation_index, list_price, previous_rent, arv,
-            rent_zestimate, low_fmr, high_fmr, zestimate, expected_rent,
-            redfin_value
-        ) VALUES (
-            %(property_id)s, %(valuation_index)s, %(list_price)s,
-            %(previous_rent)s, %(arv)s, %(rent_zestimate)s, %(low_fmr)s,
-            %(high_fmr)s, %(zestimate)s, %(expected_rent)s, %(redfin_value)s
-        )
-        """
+    def load_valuations(self, valuation_rows: List[Tuple[Any, ...]]):
         try:
-            self.cursor.executemany(insert_sql, valuation_rows)
-            self.connection.commit()
-            logger.info(f"Inserted {self.cursor.rowcount} valuations")
+            inserted = self._load_table("valuations", VALUATION_COLUMNS, valuation_rows)
+            logger.debug(f"Inserted {inserted} valuations")
+            return inserted
         except MySQLError as e:
             logger.error(f"Failed to insert valuations: {e}")
-            self.connection.rollback()
             raise
     
-    def load_hoa_fees(self, hoa_rows: List[Dict[str, Any]]):
-        insert_sql = """
-        INSERT INTO hoa_fees (property_id, hoa_index, hoa_amount, hoa_flag)
-        VALUES (%(property_id)s, %(hoa_index)s, %(hoa_amount)s, %(hoa_flag)s)
-        """
+    def load_hoa_fees(self, hoa_rows: List[Tuple[Any, ...]]):
         try:
-            self.cursor.executemany(insert_sql, hoa_rows)
-            self.connection.commit()
-            logger.info(f"Inserted {self.cursor.rowcount} HOA records")
+            inserted = self._load_table("hoa_fees", HOA_COLUMNS, hoa_rows)
+            logger.debug(f"Inserted {inserted} HOA records")
+            return inserted
         except MySQLError as e:
             logger.error(f"Failed to insert HOA fees: {e}")
-            self.connection.rollback()
             raise
     
-    def load_rehab_assessments(self, rehab_rows: List[Dict[str, Any]]):
-        insert_sql = """
-        INSERT INTO rehab_assessments (
-            property_id, rehab_index, underwriting_rehab, rehab_calculation,
-            paint, flooring_flag, foundation_flag, roof_flag, hvac_flag,
-            kitchen_flag, bathroom_flag, appliances_flag, windows_flag,
-            landscaping_flag, trashout_flag
-        ) VALUES (
-            %(property_id)s, %(rehab_index)s, %(underwriting_rehab)s,
-            %(rehab_calculation)s, %(paint)s, %(flooring_flag)s,
-            %(foundation_flag)s, %(roof_flag)s, %(hvac_flag)s,
-            %(kitchen_flag)s, %(bathroom_flag)s, %(appliances_flag)s,
-            %(windows_flag)s, %(landscaping_flag)s, %(trashout_flag)s
-        )
-        """
+    def load_rehab_assessments(self, rehab_rows: List[Tuple[Any, ...]]):
         try:
-            self.cursor.executemany(insert_sql, rehab_rows)
-            self.connection.commit()
-            logger.info(f"Inserted {self.cursor.rowcount} rehab records")
+            inserted = self._load_table("rehab_assessments", REHAB_COLUMNS, rehab_rows)
+            logger.debug(f"Inserted {inserted} rehab records")
+            return inserted
         except MySQLError as e:
             logger.error(f"Failed to insert rehab assessments: {e}")
-            self.connection.rollback()
             raise
 
 
@@ -175,31 +290,98 @@ def load_to_database(
     user: str,
     password: str,
     database: str,
-    facts: Dict[str, List[Dict[str, Any]]],
-    sql_init_file: str = None
-):
-    """Main loading function."""
-    loader = DatabaseLoader(host, user, password, database)
+    facts: Union[Dict[str, List[Tuple[Any, ...]]], Iterable[Dict[str, List[Tuple[Any, ...]]]]],
+    sql_init_file: str = None,
+    batch_size: int = 1000
+) -> Dict[str, int]:
+    """Main loading function; facts is one table->rows dict or an iterable of such batches."""
+    if isinstance(facts, dict):
+        facts = [facts]
+    
+    loaded = {table: 0 for table in FACT_TABLES}
+    loader = DatabaseLoader(host, user, password, database, batch_size=batch_size)
+    # Child tables only depend on properties, so each loads on its own connection in parallel
+    child_loaders = {
+        table: DatabaseLoader(host, user, password, database, batch_size=batch_size)
+        for table in FACT_TABLES[1:]
+    }
+    child_load_methods = {
+        "valuations": DatabaseLoader.load_valuations,
+        "hoa_fees": DatabaseLoader.load_hoa_fees,
+        "rehab_assessments": DatabaseLoader.load_rehab_assessments,
+    }
+    connected = []
+    committed = []
     
     try:
         loader.connect()
+        connected.append(loader)
         
         if sql_init_file:
             loader.execute_sql_file(sql_init_file)
         
-        if facts.get("properties"):
-            loader.load_properties(facts["properties"])
-        
-        if facts.get("valuations"):
-            loader.load_valuations(facts["valuations"])
-        
-        if facts.get("hoa_fees"):
-            loader.load_hoa_fees(facts["hoa_fees"])
+        for child_loader in child_loaders.values():
+            child_loader.connect()
+            connected.append(child_loader)
         
-        if facts.get("rehab_assessments"):
-            loader.load_rehab_assessments(facts["rehab_assessments"])
+        try:
+            # Inside the try so indexes dropped before a failure here are still restored
+            loader.disable_indexes_for_bulk(FACT_TABLES)
+            for each in connected:
+                each.begin_bulk_load()
+            
+            with ThreadPoolExecutor(max_workers=len(child_loaders)) as executor:
+                pending = []
+                for batch in facts:
+                    if batch.get("properties"):
+                        loaded["properties"] += loader.load_properties(batch["properties"])
+                    
+                    # Finish the previous batch first so each child connection has one task at a time
+                    for table, future in pending:
+                        loaded[table] += future.result()
+                    pending = [
+                        (table, executor.submit(child_load_methods[table], child_loaders[table], batch[table]))
+                        for table in child_loaders
+                        if batch.get(table)
+                    ]
+                
+                for table, future in pending:
+                    loaded[table] += future.result()
+            
+            # Commit only once every table has loaded. The per-connection commits are not atomic:
+            # if one fails, tables already committed keep their rows and only the rest roll back
+            for table, each in (("properties", loader), *child_loaders.items()):
+                each.connection.commit()
+                committed.append(table)
+        except Exception:
+            # A connection that dropped cannot roll back; log it rather than mask the original error
+            for each in connected:
+                try:
+                    each.connection.rollback()
+                except MySQLError as e:
+                    logger.error(f"Rollback failed: {e}")
+            if committed:
+                logger.error(f"Load failed after committing {', '.join(committed)}; remaining tables rolled back")
+            else:
+                logger.error("Load failed, transaction rolled back")
+            raise
+        finally:
+            # Runs after the rollback: the ALTERs commit implicitly on the properties connection
+            loader.restore_indexes()
         
-        logger.info("All data loaded successfully")
+        logger.info(
+            f"All data loaded successfully: "
+            f"{loaded['properties']} properties, "
+            f"{loaded['valuations']} valuations, "
+            f"{loaded['hoa_fees']} HOA records, "
+            f"{loaded['rehab_assessments']} rehab records"
+        )
     
     finally:
-        loader.disconnect()
+        for each in connected:
+            try:
+                each.disconnect()
+            except MySQLError as e:
+                logger.error(f"Failed to return connection to pool: {e}")
+    
+    return loaded
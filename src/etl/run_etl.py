@@ -2,13 +2,14 @@
 
 import sys
 import logging
+from itertools import chain
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.etl.config import DatabaseConfig, ETLConfig
-from src.etl.extract import load_properties_from_json
-from src.etl.transform import transform_properties
+from src.etl.extract import iter_properties_from_json
+from src.etl.transform import iter_fact_batches, new_dimensions
 from src.etl.load import load_to_database
 
 
@@ -47,62 +48,72 @@ def run_etl():
     try:
         # STEP 1: EXTRACT
         logger.info("\n" + "=" * 80)
-        logger.info("STEP 1: EXTRACT - Loading and validating properties from JSON")
+        logger.info("STEP 1: EXTRACT - Streaming validated properties from JSON")
         logger.info("=" * 80)
         
         max_records = ETLConfig.MAX_RECORDS if ETLConfig.MAX_RECORDS > 0 else None
-        valid_properties, invalid_records = load_properties_from_json(
+        invalid_records = []
+        properties = iter_properties_from_json(
             json_file_path=ETLConfig.JSON_INPUT_FILE,
             max_records=max_records,
-            skip_invalid=ETLConfig.SKIP_INVALID
+            skip_invalid=ETLConfig.SKIP_INVALID,
+            workers=ETLConfig.WORKERS or None,
+            invalid_records=invalid_records
         )
+        if not ETLConfig.SKIP_INVALID:
+            # Any invalid record aborts the run, so validate the whole file before the DDL empties the tables
+            properties = iter(list(properties))
         
-        logger.info(f"\nExtract Summary:")
-        logger.info(f"   Valid properties: {len(valid_properties)}")
-        logger.info(f"  ✗ Invalid records: {len(invalid_records)}")
-        
-        if invalid_records and len(invalid_records) <= 5:
-            logger.warning("Invalid record details:")
-            for invalid in invalid_records[:5]:
-                logger.warning(f"  Record {invalid['record_index']}: {invalid['errors'][0]}")
-        
-        if not valid_properties:
+        first_property = next(properties, None)
+        if first_property is None:
             logger.error("No valid properties to process. Exiting.")
             return False
+        properties = chain([first_property], properties)
         
         # STEP 2: TRANSFORM
         logger.info("\n" + "=" * 80)
-        logger.info("STEP 2: TRANSFORM - Normalizing property data")
+        logger.info(f"STEP 2: TRANSFORM - Normalizing property data in batches of {ETLConfig.BATCH_SIZE}")
         logger.info("=" * 80)
         
-        facts, dimensions = transform_properties(valid_properties)
-        
-        logger.info(f"\nTransform Summary:")
-        logger.info(f"   Properties fact table: {len(facts['properties'])} rows")
-        logger.info(f"   Valuations fact table: {len(facts['valuations'])} rows")
-        logger.info(f"   HOA fees fact table: {len(facts['hoa_fees'])} rows")
-        logger.info(f"   Rehab assessments fact table: {len(facts['rehab_assessments'])} rows")
-        
-        logger.info(f"\nDimension Summary:")
-        logger.info(f"   Unique markets: {len(dimensions['markets'])}")
-        logger.info(f"   Unique sources: {len(dimensions['sources'])}")
-        logger.info(f"   Unique property types: {len(dimensions['property_types'])}")
-        logger.info(f"   Unique layouts: {len(dimensions['layouts'])}")
+        dimensions = new_dimensions()
+        fact_batches = iter_fact_batches(properties, ETLConfig.BATCH_SIZE, dimensions)
         
         # STEP 3: LOAD
         logger.info("\n" + "=" * 80)
-        logger.info("STEP 3: LOAD - Loading data into MySQL database")
+        logger.info("STEP 3: LOAD - Streaming batches into MySQL database")
         logger.info("=" * 80)
         
-        load_to_database(
+        loaded = load_to_database(
             host=DatabaseConfig.HOST,
             user=DatabaseConfig.USER,
             password=DatabaseConfig.PASSWORD,
             database=DatabaseConfig.DATABASE,
-            facts=facts,
-            sql_init_file=ETLConfig.SQL_SCHEMA_FILE
+            facts=fact_batches,
+            sql_init_file=ETLConfig.SQL_SCHEMA_FILE,
+            batch_size=ETLConfig.BATCH_SIZE
         )
         
+        logger.info(f"\nExtract Summary:")
+        logger.info(f"   Valid properties: {loaded['properties']}")
+        logger.info(f"  ✗ Invalid records: {len(invalid_records)}")
+        
+        if invalid_records and len(invalid_records) <= 5:
+            logger.warning("Invalid record details:")
+            for invalid in invalid_records[:5]:
+                logger.warning(f"  Record {invalid['record_index']}: {invalid['errors'][0]}")
+        
+        logger.info(f"\nTransform Summary:")
+        logger.info(f"   Properties fact table: {loaded['properties']} rows")
+        logger.info(f"   Valuations fact table: {loaded['valuations']} rows")
+        logger.info(f"   HOA fees fact table: {loaded['hoa_fees']} rows")
+        logger.info(f"   Rehab assessments fact table: {loaded['rehab_assessments']} rows")
+        
+        logger.info(f"\nDimension Summary:")
+        logger.info(f"   Unique markets: {len(dimensions['markets'])}")
+        logger.info(f"   Unique sources: {len(dimensions['sources'])}")
+        logger.info(f"   Unique property types: {len(dimensions['property_types'])}")
+        logger.info(f"   Unique layouts: {len(dimensions['layouts'])}")
+        
         logger.info(f"\nLoad Summary:  All data successfully loaded")
         
         # FINAL SUMMARY
@@ -110,10 +121,10 @@ def run_etl():
         logger.info("ETL PIPELINE COMPLETED SUCCESSFULLY")
         logger.info("=" * 80)
         logger.info(f"\nFinal Statistics:")
-        logger.info(f"  Total properties processed: {len(valid_properties)}")
-        logger.info(f"  Total valuation snapshots: {len(facts['valuations'])}")
-        logger.info(f"  Total HOA records: {len(facts['hoa_fees'])}")
-        logger.info(f"  Total rehab assessments: {len(facts['rehab_assessments'])}")
+        logger.info(f"  Total properties processed: {loaded['properties']}")
+        logger.info(f"  Total valuation snapshots: {loaded['valuations']}")
+        logger.info(f"  Total HOA records: {loaded['hoa_fees']}")
+        logger.info(f"  Total rehab assessments: {loaded['rehab_assessments']}")
         logger.info(f"\nDatabase: {DatabaseConfig.DATABASE}")
         logger.info(f"Host: {DatabaseConfig.HOST}:{DatabaseConfig.PORT}")
         logger.info(f"\nLog file: etl_pipeline.log")
@@ -1,116 +1,123 @@
 """Transform module: Convert Property objects into normalized database rows."""
 
 import logging
-from typing import List, Dict, Tuple, Any
+from itertools import islice
+from operator import attrgetter
+from typing import List, Dict, Tuple, Any, Iterable, Iterator
 from src.models import Property
 
 logger = logging.getLogger(__name__)
 
+# Column order of each fact row; the loader inserts rows positionally in this order
+PROPERTY_COLUMNS = (
+    "property_title", "address", "street_address", "city", "state", "zip_code",
+    "latitude", "longitude", "property_type", "year_built", "sqft_total",
+    "sqft_basement", "sqft_mu", "bed", "bath", "layout", "pool", "parking",
+    "basement_yes_no", "water", "sewage", "htw", "commercial", "highway", "train",
+    "flood", "occupancy", "net_yield", "irr", "taxes", "tax_rate", "market", "source",
+    "neighborhood_rating", "school_average", "subdivision", "reviewed_status",
+    "most_recent_status", "selling_reason", "final_reviewer",
+    "seller_retained_broker", "rent_restricted",
+)
 
-def transform_properties_to_facts(properties: List[Property]) -> Dict[str, List[Dict[str, Any]]]:
-    """Transform denormalized Property objects into normalized table rows."""
-    facts = {
+VALUATION_COLUMNS = (
+    "property_id", "valuation_index", "list_price", "previous_rent", "arv",
+    "rent_zestimate", "low_fmr", "high_fmr", "zestimate", "expected_rent",
+    "redfin_value",
+)
+
+HOA_COLUMNS = ("property_id", "hoa_index", "hoa_amount", "hoa_flag")
+
+REHAB_COLUMNS = (
+    "property_id", "rehab_index", "underwriting_rehab", "rehab_calculation",
+    "paint", "flooring_flag", "foundation_flag", "roof_flag", "hvac_flag",
+    "kitchen_flag", "bathroom_flag", "appliances_flag", "windows_flag",
+    "landscaping_flag", "trashout_flag",
+)
+
+# Child rows are (property_id, index) followed by the record's own fields
+_get_property_values = attrgetter(*PROPERTY_COLUMNS)
+_get_valuation_values = attrgetter(*VALUATION_COLUMNS[2:])
+_get_hoa_values = attrgetter(*HOA_COLUMNS[2:])
+_get_rehab_values = attrgetter(*REHAB_COLUMNS[2:])
+
+_MARKET = PROPERTY_COLUMNS.index("market")
+_SOURCE = PROPERTY_COLUMNS.index("source")
+_PROPERTY_TYPE = PROPERTY_COLUMNS.index("property_type")
+_LAYOUT = PROPERTY_COLUMNS.index("layout")
+
+
+def _new_facts() -> Dict[str, List[Tuple[Any, ...]]]:
+    return {
         "properties": [],
         "valuations": [],
         "hoa_fees": [],
         "rehab_assessments": []
     }
+
+
+def new_dimensions() -> Dict[str, set]:
+    """Create an empty dimension-value accumulator."""
+    return {
+        "markets": set(),
+        "sources": set(),
+        "property_types": set(),
+        "layouts": set(),
+    }
+
+
+def _append_facts(
+    facts: Dict[str, List[Tuple[Any, ...]]],
+    properties: Iterable[Property],
+    first_property_id: int,
+    dimensions: Dict[str, set]
+):
+    """Append the rows for each property, numbering properties from first_property_id."""
+    markets = dimensions["markets"]
+    sources = dimensions["sources"]
+    property_types = dimensions["property_types"]
+    layouts = dimensions["layouts"]
     
-    logger.info(f"Transforming {len(properties)} properties to facts")
+    # Bound appends skip the dict lookup and method lookup for every row
+    append_property = facts["properties"].append
+    append_valuation = facts["valuations"].append
+    append_hoa = facts["hoa_fees"].append
+    append_rehab = facts["rehab_assessments"].append
     
-    for property_obj in properties:
-        property_row = {
-            "property_title": property_obj.property_title,
-            "address": property_obj.address,
-            "street_address": property_obj.street_address,
-            "city": property_obj.city,
-            "state": property_obj.state,
-            "zip_code": property_obj.zip_code,
-            "latitude": property_obj.latitude,
-            "longitude": property_obj.longitude,
-            "property_type": property_obj.property_type,
-            "year_built": property_obj.year_built,
-            "sqft_total": property_obj.sqft_total,
-            "sqft_basement": property_obj.sqft_basement,
-            "sqft_mu": property_obj.sqft_mu,
-            "bed": property_obj.bed,
-            "bath": property_obj.bath,
-            "layout": property_obj.layout,
-            "pool": property_obj.pool,
-            "parking": property_obj.parking,
-            "basement_yes_no": property_obj.basement_yes_no,
-            "water": property_obj.water,
-            "sewage": property_obj.sewage,
-            "htw": property_obj.htw,
-            "commercial": property_obj.commercial,
-            "highway": property_obj.highway,
-            "train": property_obj.train,
-            "flood": property_obj.flood,
-            "occupancy": property_obj.occupancy,
-            "net_yield": property_obj.net_yield,
-            "irr": property_obj.irr,
-            "taxes": property_obj.taxes,
-            "tax_rate": property_obj.tax_rate,
-            "market": property_obj.market,
-            "source": property_obj.source,
-            "neighborhood_rating": property_obj.neighborhood_rating,
-            "school_average": property_obj.school_average,
-            "subdivision": property_obj.subdivision,
-            "reviewed_status": property_obj.reviewed_status,
-            "most_recent_status": property_obj.most_recent_status,
-            "selling_reason": property_obj.selling_reason,
-            "final_reviewer": property_obj.final_reviewer,
-            "seller_retained_broker": property_obj.seller_retained_broker,
-            "rent_restricted": property_obj.rent_restricted,
-        }
-        facts["properties"].append(property_row)
+    for property_id, property_obj in enumerate(properties, first_property_id):
+        property_row = _get_property_values(property_obj)
+        append_property(property_row)
         
-        property_id = len(facts["properties"])
+        # Dimensions are collected in the same pass rather than re-scanning the rows
+        if property_row[_MARKET]:
+            markets.add(property_row[_MARKET])
+        if property_row[_SOURCE]:
+            sources.add(property_row[_SOURCE])
+        if property_row[_PROPERTY_TYPE]:
+            property_types.add(property_row[_PROPERTY_TYPE])
+        if property_row[_LAYOUT]:
+            layouts.add(property_row[_LAYOUT])
         
-        for val_idx, val_record in enumerate(property_obj.valuation):
-            valuation_row = {
-                "property_id": property_id,
-                "valuation_index": val_idx + 1,
-                "list_price": val_record.list_price,
-                "previous_rent": val_record.previous_rent,
-                "arv": val_record.arv,
-                "rent_zestimate": val_record.rent_zestimate,
-                "low_fmr": val_record.low_fmr,
-                "high_fmr": val_record.high_fmr,
-                "zestimate": val_record.zestimate,
-                "expected_rent": val_record.expected_rent,
-                "redfin_value": val_record.redfin_value,
-            }
-            facts["valuations"].append(valuation_row)
+        for val_idx, val_record in enumerate(property_obj.valuation, 1):
+            append_valuation((property_id, val_idx) + _get_valuation_values(val_record))
         
-        for hoa_idx, hoa_record in enumerate(property_obj.hoa):
-            hoa_row = {
-                "property_id": property_id,
-                "hoa_index": hoa_idx + 1,
-                "hoa_amount": hoa_record.hoa_amount,
-                "hoa_flag": hoa_record.hoa_flag,
-            }
-            facts["hoa_fees"].append(hoa_row)
+        for hoa_idx, hoa_record in enumerate(property_obj.hoa, 1):
+            append_hoa((property_id, hoa_idx) + _get_hoa_values(hoa_record))
         
-        for rehab_idx, rehab_record in enumerate(property_obj.rehab):
-            rehab_row = {
-                "property_id": property_id,
-                "rehab_index": rehab_idx + 1,
-                "underwriting_rehab": rehab_record.underwriting_rehab,
-                "rehab_calculation": rehab_record.rehab_calculation,
-                "paint": rehab_record.paint,
-                "flooring_flag": rehab_record.flooring_flag,
-                "foundation_flag": rehab_record.foundation_flag,
-                "roof_flag": rehab_record.roof_flag,
-                "hvac_flag": rehab_record.hvac_flag,
-                "kitchen_flag": rehab_record.kitchen_flag,
-                "bathroom_flag": rehab_record.bathroom_flag,
-                "appliances_flag": rehab_record.appliances_flag,
-                "windows_flag": rehab_record.windows_flag,
-                "landscaping_flag": rehab_record.landscaping_flag,
-                "trashout_flag": rehab_record.trashout_flag,
-            }
-            facts["rehab_assessments"].append(rehab_row)
+        for rehab_idx, rehab_record in enumerate(property_obj.rehab, 1):
+            append_rehab((property_id, rehab_idx) + _get_rehab_values(rehab_record))
+
+
+def transform_properties_to_facts(
+    properties: List[Property],
+    dimensions: Dict[str, set] = None
+) -> Dict[str, List[Tuple[Any, ...]]]:
+    """Transform denormalized Property objects into normalized table rows."""
+    facts = _new_facts()
+    
+    logger.info(f"Transforming {len(properties)} properties to facts")
+    
+    _append_facts(facts, properties, 1, dimensions if dimensions is not None else new_dimensions())
     
     logger.info(
         f"Transformation complete: "
@@ -123,25 +130,7 @@ def transform_properties_to_facts(properties: List[Property]) -> Dict[str, List[
     return facts
 
 
-def extract_dimension_values(facts: Dict[str, List[Dict[str, Any]]]) -> Dict[str, set]:
-    """Extract unique dimension values from facts."""
-    dimensions = {
-        "markets": set(),
-        "sources": set(),
-        "property_types": set(),
-        "layouts": set(),
-    }
-    
-    for prop in facts["properties"]:
-        if prop.get("market"):
-            dimensions["markets"].add(prop["market"])
-        if prop.get("source"):
-            dimensions["sources"].add(prop["source"])
-        if prop.get("property_type"):
-            dimensions["property_types"].add(prop["property_type"])
-        if prop.get("layout"):
-            dimensions["layouts"].add(prop["layout"])
-    
+def _log_dimensions(dimensions: Dict[str, set]):
     logger.info(
         f"Extracted dimensions: "
         f"{len(dimensions['markets'])} markets, "
@@ -149,12 +138,34 @@ def extract_dimension_values(facts: Dict[str, List[Dict[str, Any]]]) -> Dict[str
         f"{len(dimensions['property_types'])} types, "
         f"{len(dimensions['layouts'])} layouts"
     )
+
+
+def iter_fact_batches(
+    properties: Iterable[Property],
+    batch_size: int = 1000,
+    dimensions: Dict[str, set] = None
+) -> Iterator[Dict[str, List[Tuple[Any, ...]]]]:
+    """Stream facts for batch_size properties at a time, accumulating into dimensions if given."""
+    property_iter = iter(properties)
+    next_property_id = 1
+    if dimensions is None:
+        dimensions = new_dimensions()
     
-    return dimensions
+    while True:
+        batch = list(islice(property_iter, batch_size))
+        if not batch:
+            return
+        
+        facts = _new_facts()
+        _append_facts(facts, batch, next_property_id, dimensions)
+        next_property_id += len(batch)
+        
+        yield facts
 
 
-def transform_properties(properties: List[Property]) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, set]]:
+def transform_properties(properties: List[Property]) -> Tuple[Dict[str, List[Tuple[Any, ...]]], Dict[str, set]]:
     """Main transformation orchestration."""
-    facts = transform_properties_to_facts(properties)
-    dimensions = extract_dimension_values(facts)
+    dimensions = new_dimensions()
+    facts = transform_properties_to_facts(properties, dimensions)
+    _log_dimensions(dimensions)
     return facts, dimensions
@@ -1,5 +1,18 @@
 """Models package for property data validation and transformation."""
 
-from .property import Property, ValuationRecord, HOARecord, RehabRecord
+from typing import TYPE_CHECKING
 
-__all__ = ["Property", "ValuationRecord", "HOARecord", "RehabRecord"]
+if TYPE_CHECKING:
+    from .property import Property, ValuationRecord, HOARecord, RehabRecord, preprocess_row
+
+__all__ = ["Property", "ValuationRecord", "HOARecord", "RehabRecord", "preprocess_row"]
+
+
+def __getattr__(name):
+    # Defer importing pydantic and building the model schemas until a model is first used
+    if name in __all__:
+        from . import property as _property
+        value = getattr(_property, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
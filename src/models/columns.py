@@ -0,0 +1,101 @@
+"""Columnar view of a property batch for vectorized analytics."""
+
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from .property import Property, PropertyBatch
+
+# Numeric fields stored as float64 arrays; missing values become NaN
+NUMERIC_COLUMNS = (
+    "latitude", "longitude", "sqft_total", "sqft_basement", "sqft_mu",
+    "net_yield", "irr", "taxes", "tax_rate", "school_average",
+)
+# Small integer fields stored narrow, with a sentinel for missing values and a
+# parallel <name>_mask array that is True where the value is present. A column holding a value
+# outside its dtype's range is stored as int64 instead
+SMALL_INT_COLUMNS = {
+    "year_built": (np.uint16, 0),
+    "bed": (np.int16, -1),
+    "bath": (np.int16, -1),
+    "neighborhood_rating": (np.int16, -1),
+}
+# Low-cardinality string fields stored as pandas Categoricals (codes + one copy per value)
+CATEGORICAL_COLUMNS = (
+    "state", "property_type", "layout", "market", "source",
+)
+# Nearly unique string fields stored as object arrays, where a Categorical would only add codes
+OBJECT_COLUMNS = ("city", "zip_code")
+
+_get_column_values = attrgetter(*NUMERIC_COLUMNS, *SMALL_INT_COLUMNS, *CATEGORICAL_COLUMNS, *OBJECT_COLUMNS)
+
+
+@dataclass
+class PropertyColumns:
+    """Struct-of-arrays copy of the scalar property fields, one entry per property."""
+    latitude: np.ndarray
+    longitude: np.ndarray
+    sqft_total: np.ndarray
+    sqft_basement: np.ndarray
+    sqft_mu: np.ndarray
+    net_yield: np.ndarray
+    irr: np.ndarray
+    taxes: np.ndarray
+    tax_rate: np.ndarray
+    school_average: np.ndarray
+    year_built: np.ndarray
+    year_built_mask: np.ndarray
+    bed: np.ndarray
+    bed_mask: np.ndarray
+    bath: np.ndarray
+    bath_mask: np.ndarray
+    neighborhood_rating: np.ndarray
+    neighborhood_rating_mask: np.ndarray
+    state: pd.Categorical
+    property_type: pd.Categorical
+    layout: pd.Categorical
+    market: pd.Categorical
+    source: pd.Categorical
+    city: np.ndarray
+    zip_code: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.latitude)
+    
+    @classmethod
+    def from_properties(cls, properties: List[Property]) -> "PropertyColumns":
+        """Build the columns in one pass over the properties."""
+        rows = list(map(_get_column_values, properties))
+        # Transpose the row tuples into per-field columns
+        if rows:
+            columns = list(zip(*rows))
+        else:
+            columns = [()] * (
+                len(NUMERIC_COLUMNS) + len(SMALL_INT_COLUMNS) + len(CATEGORICAL_COLUMNS) + len(OBJECT_COLUMNS)
+            )
+        columns = iter(columns)
+        
+        values = {}
+        for name, column in zip(NUMERIC_COLUMNS, columns):
+            values[name] = np.array(column, dtype=np.float64)
+        for (name, (dtype, missing)), column in zip(SMALL_INT_COLUMNS.items(), columns):
+            column_values = [missing if v is None else v for v in column]
+            # np.array wraps out-of-range integers silently on numpy 1.x, so check the bounds first
+            limits = np.iinfo(dtype)
+            if column_values and (min(column_values) < limits.min or max(column_values) > limits.max):
+                dtype = np.int64
+            values[name] = np.array(column_values, dtype=dtype)
+            values[f"{name}_mask"] = np.array([v is not None for v in column], dtype=bool)
+        for name, column in zip(CATEGORICAL_COLUMNS, columns):
+            values[name] = pd.Categorical(column)
+        for name, column in zip(OBJECT_COLUMNS, columns):
+            values[name] = np.array(column, dtype=object)
+        return cls(**values)
+    
+    @classmethod
+    def from_batch(cls, batch: PropertyBatch) -> "PropertyColumns":
+        """Build the columns for a PropertyBatch."""
+        return cls.from_properties(batch.properties)
@@ -1,7 +1,126 @@
 """Pydantic models for property data validation."""
 
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional
+import re
+import sys
+import orjson
+from pydantic import BaseModel, Field, computed_field
+from typing import Any, Dict, List, Literal, Optional, Union
+
+YesNo = Literal["YES", "NO"]
+
+# Canonical flag values shared by every normalized field
+_YES = sys.intern("YES")
+_NO = sys.intern("NO")
+_YES_NO = {"YES": _YES, "NO": _NO, "Yes": _YES, "No": _NO, "yes": _YES, "no": _NO}
+
+# Everything but digits and the decimal point, stripped from values like '5649 sqft'
+_SQFT_RE = re.compile(r"[^\d.]+")
+
+
+def _canonical_yes_no(v: str) -> Optional[str]:
+    # Common spellings resolve with one lookup and no strip()/upper() copies
+    flag = _YES_NO.get(v)
+    if flag is None:
+        flag = _YES_NO.get(v.strip().upper())
+    return flag
+
+
+def normalize_flag(v):
+    """Normalize a YES/NO condition flag; anything else becomes None."""
+    if isinstance(v, str):
+        return _canonical_yes_no(v)
+    return None
+
+
+def normalize_yes_no(v):
+    """Uppercase YES/NO values, leaving other values untouched."""
+    if isinstance(v, str):
+        flag = _canonical_yes_no(v)
+        if flag is not None:
+            return flag
+    return v
+
+
+def empty_to_none(v):
+    """Treat blank strings as missing."""
+    if isinstance(v, str) and not v.strip():
+        return None
+    return v
+
+
+def clean_sqft(v):
+    """Clean sqft from string like '5649 sqft' to float."""
+    if v is None:
+        return None
+    if isinstance(v, str):
+        numeric_str = _SQFT_RE.sub("", v)
+        if not numeric_str:
+            return None
+        try:
+            return float(numeric_str)
+        except ValueError:
+            return None
+    try:
+        return float(v)
+    except (ValueError, TypeError):
+        return None
+
+
+# Raw-record keys and their normalizers, applied by preprocess_row before validation
+_ROW_NORMALIZERS = {
+    "SQFT_Total": clean_sqft,
+    "Reviewed_Status": empty_to_none,
+    "Occupancy": empty_to_none,
+    "Flood": empty_to_none,
+    "Rent_Restricted": normalize_yes_no,
+    "Pool": normalize_yes_no,
+    "Commercial": normalize_yes_no,
+    "HTW": normalize_yes_no,
+}
+# Low-cardinality string keys whose values are interned so repeats share one object
+_INTERNED_KEYS = (
+    "State", "Market", "Source", "Property_Type", "Subdivision", "Layout",
+    "Parking", "BasementYesNo", "Water", "Sewage", "Highway", "Train",
+    "Flood", "Occupancy", "Reviewed_Status", "Most_Recent_Status",
+    "Selling_Reason", "Final_Reviewer", "Seller_Retained_Broker",
+)
+_REHAB_FLAG_KEYS = (
+    "Flooring_Flag", "Foundation_Flag", "Roof_Flag", "HVAC_Flag",
+    "Kitchen_Flag", "Bathroom_Flag", "Appliances_Flag", "Windows_Flag",
+    "Landscaping_Flag", "Trashout_Flag",
+)
+
+
+def preprocess_row(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a raw (alias-keyed) property record in place before validation."""
+    # Non-object elements pass through so model_validate reports them as invalid
+    if not isinstance(record, dict):
+        return record
+    
+    for key, normalize in _ROW_NORMALIZERS.items():
+        if key in record:
+            record[key] = normalize(record[key])
+    
+    for key in _INTERNED_KEYS:
+        value = record.get(key)
+        if type(value) is str:
+            record[key] = sys.intern(value)
+    
+    hoa_records = record.get("HOA")
+    if isinstance(hoa_records, list):
+        for hoa_record in hoa_records:
+            if isinstance(hoa_record, dict) and "HOA_Flag" in hoa_record:
+                hoa_record["HOA_Flag"] = normalize_flag(hoa_record["HOA_Flag"])
+    
+    rehab_records = record.get("Rehab")
+    if isinstance(rehab_records, list):
+        for rehab_record in rehab_records:
+            if isinstance(rehab_record, dict):
+                for key in _REHAB_FLAG_KEYS:
+                    if key in rehab_record:
+                        rehab_record[key] = normalize_flag(rehab_record[key])
+    
+    return record
 
 
 class ValuationRecord(BaseModel):
@@ -16,27 +135,25 @@ class ValuationRecord(BaseModel):
     expected_rent: Optional[float] = Field(None, alias="Expected_Rent")
     redfin_value: Optional[float] = Field(None, alias="Redfin_Value")
     
-    model_config = {"populate_by_name": True}
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "ValuationRecord":
+        """Build from already-validated data without running validators."""
+        return _construct_trusted(cls, data)
+    
+    model_config = {"populate_by_name": True, "frozen": True}
 
 
 class HOARecord(BaseModel):
     """HOA fee information."""
     hoa_amount: Optional[float] = Field(None, alias="HOA")
-    hoa_flag: Optional[str] = Field(None, alias="HOA_Flag")
+    hoa_flag: Optional[YesNo] = Field(None, alias="HOA_Flag")
     
-    @field_validator("hoa_flag", mode="before")
     @classmethod
-    def validate_flag(cls, v):
-        if v is None:
-            return None
-        if isinstance(v, str):
-            v_upper = v.strip().upper()
-            if v_upper not in ["YES", "NO"]:
-                return None
-            return v_upper
-        return None
+    def from_trusted(cls, data: Dict[str, Any]) -> "HOARecord":
+        """Build from already-validated data without running validators."""
+        return _construct_trusted(cls, data)
     
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True}
 
 
 class RehabRecord(BaseModel):
@@ -44,39 +161,30 @@ class RehabRecord(BaseModel):
     underwriting_rehab: Optional[float] = Field(None, alias="Underwriting_Rehab")
     rehab_calculation: Optional[float] = Field(None, alias="Rehab_Calculation")
     paint: Optional[str] = Field(None, alias="Paint")
-    flooring_flag: Optional[str] = Field(None, alias="Flooring_Flag")
-    foundation_flag: Optional[str] = Field(None, alias="Foundation_Flag")
-    roof_flag: Optional[str] = Field(None, alias="Roof_Flag")
-    hvac_flag: Optional[str] = Field(None, alias="HVAC_Flag")
-    kitchen_flag: Optional[str] = Field(None, alias="Kitchen_Flag")
-    bathroom_flag: Optional[str] = Field(None, alias="Bathroom_Flag")
-    appliances_flag: Optional[str] = Field(None, alias="Appliances_Flag")
-    windows_flag: Optional[str] = Field(None, alias="Windows_Flag")
-    landscaping_flag: Optional[str] = Field(None, alias="Landscaping_Flag")
-    trashout_flag: Optional[str] = Field(None, alias="Trashout_Flag")
-    
-    @field_validator(
-        "flooring_flag", "foundation_flag", "roof_flag", "hvac_flag",
-        "kitchen_flag", "bathroom_flag", "appliances_flag", "windows_flag",
-        "landscaping_flag", "trashout_flag",
-        mode="before"
-    )
+    flooring_flag: Optional[YesNo] = Field(None, alias="Flooring_Flag")
+    foundation_flag: Optional[YesNo] = Field(None, alias="Foundation_Flag")
+    roof_flag: Optional[YesNo] = Field(None, alias="Roof_Flag")
+    hvac_flag: Optional[YesNo] = Field(None, alias="HVAC_Flag")
+    kitchen_flag: Optional[YesNo] = Field(None, alias="Kitchen_Flag")
+    bathroom_flag: Optional[YesNo] = Field(None, alias="Bathroom_Flag")
+    appliances_flag: Optional[YesNo] = Field(None, alias="Appliances_Flag")
+    windows_flag: Optional[YesNo] = Field(None, alias="Windows_Flag")
+    landscaping_flag: Optional[YesNo] = Field(None, alias="Landscaping_Flag")
+    trashout_flag: Optional[YesNo] = Field(None, alias="Trashout_Flag")
+    
     @classmethod
-    def normalize_flags(cls, v):
-        if v is None:
-            return None
-        if isinstance(v, str):
-            v_upper = v.strip().upper()
-            if v_upper not in ["YES", "NO"]:
-                return None
-            return v_upper
-        return None
+    def from_trusted(cls, data: Dict[str, Any]) -> "RehabRecord":
+        """Build from already-validated data without running validators."""
+        return _construct_trusted(cls, data)
     
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True}
 
 
 class Property(BaseModel):
-    """Core property entity with all denormalized data."""
+    """Core property entity with all denormalized data.
+    
+    Raw records must pass through preprocess_row before model_validate.
+    """
     
     # Identifiers
     property_title: str = Field(..., alias="Property_Title")
@@ -139,50 +247,116 @@ class Property(BaseModel):
     hoa: List[HOARecord] = Field(default_factory=list, alias="HOA")
     rehab: List[RehabRecord] = Field(default_factory=list, alias="Rehab")
     
-    @field_validator("sqft_total", mode="before")
     @classmethod
-    def clean_sqft_total(cls, v):
-        """Clean sqft from string like '5649 sqft' to float."""
-        if v is None:
-            return None
-        if isinstance(v, str):
-            numeric_str = "".join(c for c in v if c.isdigit() or c == ".")
-            try:
-                return float(numeric_str) if numeric_str else None
-            except ValueError:
-                return None
-        try:
-            return float(v)
-        except (ValueError, TypeError):
-            return None
+    def from_trusted(cls, data: Dict[str, Any]) -> "Property":
+        """Build from already-validated data without running validators.
+        
+        Only for records from this pipeline's own output; untrusted input must
+        still go through model_validate.
+        """
+        property_obj = _construct_trusted(cls, data)
+        values = property_obj.__dict__
+        values["valuation"] = [ValuationRecord.from_trusted(r) for r in values.get("valuation", ())]
+        values["hoa"] = [HOARecord.from_trusted(r) for r in values.get("hoa", ())]
+        values["rehab"] = [RehabRecord.from_trusted(r) for r in values.get("rehab", ())]
+        return property_obj
     
-    @field_validator("reviewed_status", "occupancy", "flood", mode="before")
     @classmethod
-    def normalize_empty_strings(cls, v):
-        if isinstance(v, str) and not v.strip():
-            return None
-        return v
+    def loads(cls, data: bytes) -> "Property":
+        """Parse a trusted JSON property with orjson and build it without validation."""
+        return cls.from_trusted(orjson.loads(data))
     
-    @field_validator("rent_restricted", "pool", "commercial", "htw", mode="before")
     @classmethod
-    def normalize_yes_no_flags(cls, v):
-        if v is None:
-            return None
-        if isinstance(v, str):
-            v_upper = v.strip().upper()
-            if v_upper in ["YES", "NO"]:
-                return v_upper
-        return v
+    def loads_validated(cls, data: bytes) -> "Property":
+        """Parse an untrusted JSON property with orjson, then normalize and validate it."""
+        return cls.model_validate(preprocess_row(orjson.loads(data)))
     
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True}
+
+
+def _alias_map(model: type) -> Dict[str, str]:
+    """Map both aliases and field names to field names (models use populate_by_name)."""
+    aliases = {}
+    for name, field in model.model_fields.items():
+        aliases[name] = name
+        if field.alias:
+            aliases[field.alias] = name
+    return aliases
+
+
+def _default_values(model: type) -> Dict[str, Any]:
+    return {
+        name: field.default
+        for name, field in model.model_fields.items()
+        if not field.is_required() and field.default_factory is None
+    }
+
+
+def _build_instance(model: type, values: Dict[str, Any], fields_set: set):
+    """Set instance state directly, as model_construct does."""
+    obj = model.__new__(model)
+    object.__setattr__(obj, "__dict__", values)
+    object.__setattr__(obj, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(obj, "__pydantic_extra__", None)
+    object.__setattr__(obj, "__pydantic_private__", None)
+    return obj
+
+
+def _construct_trusted(model: type, data: Dict[str, Any]):
+    """Build from alias- or name-keyed data, skipping model_construct's per-field default lookups."""
+    values = dict(model._DEFAULTS)
+    fields_set = set()
+    alias_map = model._ALIAS_MAP
+    for key, value in data.items():
+        name = alias_map.get(key)
+        if name is not None:
+            values[name] = value
+            fields_set.add(name)
+    
+    return _build_instance(model, values, fields_set)
+
+
+# Field maps for the trusted construction path, resolved once at import
+for _model in (ValuationRecord, HOARecord, RehabRecord, Property):
+    _model._ALIAS_MAP = _alias_map(_model)
+    _model._DEFAULTS = _default_values(_model)
+del _model
 
 
 class PropertyBatch(BaseModel):
     """Wrapper for batch processing multiple properties."""
     properties: List[Property]
-    total_count: int = 0
     
-    def __init__(self, **data):
-        super().__init__(**data)
-        if not self.total_count and self.properties:
-            self.total_count = len(self.properties)
+    @computed_field
+    @property
+    def total_count(self) -> int:
+        return len(self.properties)
+    
+    @classmethod
+    def from_records(cls, records: Union[List[Dict[str, Any]], bytes]) -> "PropertyBatch":
+        """Decode a whole batch with msgspec, then wrap it without re-validating.
+        
+        records is either a list of raw dicts or the bytes of a JSON array; any
+        invalid record raises msgspec.ValidationError for the whole batch.
+        """
+        from . import property_fast
+        
+        if isinstance(records, (bytes, bytearray, memoryview)):
+            decoded = property_fast.decode_list(records)
+        else:
+            decoded = property_fast.convert_list(records)
+        
+        return cls._from_decoded(decoded)
+    
+    @classmethod
+    def loads(cls, data: bytes) -> "PropertyBatch":
+        """Parse a trusted JSON array of properties with orjson and build it without validation."""
+        properties = [Property.from_trusted(record) for record in orjson.loads(data)]
+        return cls.model_construct(properties=properties)
+    
+    @classmethod
+    def _from_decoded(cls, decoded: list) -> "PropertyBatch":
+        from . import property_fast
+        
+        properties = [property_fast.to_model(prop) for prop in decoded]
+        return cls.model_construct(properties=properties)
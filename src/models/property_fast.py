@@ -0,0 +1,256 @@
+"""msgspec mirrors of the property models for decoding trusted input without Pydantic."""
+
+from typing import List, Optional, Union
+
+import msgspec
+
+from .property import (
+    Property,
+    ValuationRecord,
+    HOARecord,
+    RehabRecord,
+    _build_instance,
+    normalize_flag,
+    normalize_yes_no,
+    empty_to_none,
+    clean_sqft,
+)
+
+
+class ValuationRecordS(msgspec.Struct, kw_only=True, rename={
+    "list_price": "List_Price",
+    "previous_rent": "Previous_Rent",
+    "arv": "ARV",
+    "rent_zestimate": "Rent_Zestimate",
+    "low_fmr": "Low_FMR",
+    "high_fmr": "High_FMR",
+    "zestimate": "Zestimate",
+    "expected_rent": "Expected_Rent",
+    "redfin_value": "Redfin_Value",
+}):
+    """Valuation snapshot for a property."""
+    list_price: Optional[float] = None
+    previous_rent: Optional[float] = None
+    arv: Optional[float] = None
+    rent_zestimate: Optional[float] = None
+    low_fmr: Optional[float] = None
+    high_fmr: Optional[float] = None
+    zestimate: Optional[float] = None
+    expected_rent: Optional[float] = None
+    redfin_value: Optional[float] = None
+
+
+class HOARecordS(msgspec.Struct, kw_only=True, rename={
+    "hoa_amount": "HOA",
+    "hoa_flag": "HOA_Flag",
+}):
+    """HOA fee information."""
+    hoa_amount: Optional[float] = None
+    hoa_flag: Optional[str] = None
+
+
+class RehabRecordS(msgspec.Struct, kw_only=True, rename={
+    "underwriting_rehab": "Underwriting_Rehab",
+    "rehab_calculation": "Rehab_Calculation",
+    "paint": "Paint",
+    "flooring_flag": "Flooring_Flag",
+    "foundation_flag": "Foundation_Flag",
+    "roof_flag": "Roof_Flag",
+    "hvac_flag": "HVAC_Flag",
+    "kitchen_flag": "Kitchen_Flag",
+    "bathroom_flag": "Bathroom_Flag",
+    "appliances_flag": "Appliances_Flag",
+    "windows_flag": "Windows_Flag",
+    "landscaping_flag": "Landscaping_Flag",
+    "trashout_flag": "Trashout_Flag",
+}):
+    """Rehab assessment and condition flags."""
+    underwriting_rehab: Optional[float] = None
+    rehab_calculation: Optional[float] = None
+    paint: Optional[str] = None
+    flooring_flag: Optional[str] = None
+    foundation_flag: Optional[str] = None
+    roof_flag: Optional[str] = None
+    hvac_flag: Optional[str] = None
+    kitchen_flag: Optional[str] = None
+    bathroom_flag: Optional[str] = None
+    appliances_flag: Optional[str] = None
+    windows_flag: Optional[str] = None
+    landscaping_flag: Optional[str] = None
+    trashout_flag: Optional[str] = None
+
+
+class PropertyS(msgspec.Struct, kw_only=True, rename={
+    "property_title": "Property_Title",
+    "address": "Address",
+    "street_address": "Street_Address",
+    "city": "City",
+    "state": "State",
+    "zip_code": "Zip",
+    "latitude": "Latitude",
+    "longitude": "Longitude",
+    "property_type": "Property_Type",
+    "year_built": "Year_Built",
+    "sqft_total": "SQFT_Total",
+    "sqft_basement": "SQFT_Basement",
+    "sqft_mu": "SQFT_MU",
+    "bed": "Bed",
+    "bath": "Bath",
+    "layout": "Layout",
+    "pool": "Pool",
+    "parking": "Parking",
+    "basement_yes_no": "BasementYesNo",
+    "water": "Water",
+    "sewage": "Sewage",
+    "htw": "HTW",
+    "commercial": "Commercial",
+    "highway": "Highway",
+    "train": "Train",
+    "flood": "Flood",
+    "occupancy": "Occupancy",
+    "net_yield": "Net_Yield",
+    "irr": "IRR",
+    "taxes": "Taxes",
+    "tax_rate": "Tax_Rate",
+    "market": "Market",
+    "source": "Source",
+    "neighborhood_rating": "Neighborhood_Rating",
+    "school_average": "School_Average",
+    "subdivision": "Subdivision",
+    "reviewed_status": "Reviewed_Status",
+    "most_recent_status": "Most_Recent_Status",
+    "selling_reason": "Selling_Reason",
+    "final_reviewer": "Final_Reviewer",
+    "seller_retained_broker": "Seller_Retained_Broker",
+    "rent_restricted": "Rent_Restricted",
+    "valuation": "Valuation",
+    "hoa": "HOA",
+    "rehab": "Rehab",
+}):
+    """Core property entity with all denormalized data."""
+    
+    # Identifiers
+    property_title: str
+    address: str
+    
+    # Location
+    street_address: str
+    city: str
+    state: str
+    zip_code: str
+    latitude: float
+    longitude: float
+    
+    # Characteristics
+    property_type: str
+    year_built: Optional[int] = None
+    sqft_total: Union[float, str, None] = None
+    sqft_basement: Optional[float] = None
+    sqft_mu: Optional[float] = None
+    bed: Optional[int] = None
+    bath: Optional[int] = None
+    
+    # Features
+    layout: Optional[str] = None
+    pool: Optional[str] = None
+    parking: Optional[str] = None
+    basement_yes_no: Optional[str] = None
+    water: Optional[str] = None
+    sewage: Optional[str] = None
+    htw: Optional[str] = None
+    commercial: Optional[str] = None
+    highway: Optional[str] = None
+    train: Optional[str] = None
+    flood: Optional[str] = None
+    occupancy: Optional[str] = None
+    
+    # Financial
+    net_yield: Optional[float] = None
+    irr: Optional[float] = None
+    taxes: Optional[float] = None
+    tax_rate: Optional[float] = None
+    
+    # Market
+    market: Optional[str] = None
+    source: Optional[str] = None
+    neighborhood_rating: Optional[int] = None
+    school_average: Optional[float] = None
+    subdivision: Optional[str] = None
+    
+    # Status
+    reviewed_status: Optional[str] = None
+    most_recent_status: Optional[str] = None
+    selling_reason: Optional[str] = None
+    final_reviewer: Optional[str] = None
+    seller_retained_broker: Optional[str] = None
+    rent_restricted: Optional[str] = None
+    
+    # Nested records
+    valuation: List[ValuationRecordS] = msgspec.field(default_factory=list)
+    hoa: List[HOARecordS] = msgspec.field(default_factory=list)
+    rehab: List[RehabRecordS] = msgspec.field(default_factory=list)
+
+
+# Fields normalized after decoding, mirroring preprocess_row
+_YES_NO_FIELDS = ("rent_restricted", "pool", "commercial", "htw")
+_EMPTY_STRING_FIELDS = ("reviewed_status", "occupancy", "flood")
+_REHAB_FLAG_FIELDS = (
+    "flooring_flag", "foundation_flag", "roof_flag", "hvac_flag",
+    "kitchen_flag", "bathroom_flag", "appliances_flag", "windows_flag",
+    "landscaping_flag", "trashout_flag",
+)
+
+# strict=False keeps Pydantic's lax coercions such as "3" -> 3
+DECODER = msgspec.json.Decoder(PropertyS, strict=False)
+LIST_DECODER = msgspec.json.Decoder(List[PropertyS], strict=False)
+
+
+def _postprocess(prop: PropertyS) -> PropertyS:
+    """Apply preprocess_row's normalization to a decoded struct in place."""
+    prop.sqft_total = clean_sqft(prop.sqft_total)
+    for name in _YES_NO_FIELDS:
+        setattr(prop, name, normalize_yes_no(getattr(prop, name)))
+    for name in _EMPTY_STRING_FIELDS:
+        setattr(prop, name, empty_to_none(getattr(prop, name)))
+    for hoa_record in prop.hoa:
+        hoa_record.hoa_flag = normalize_flag(hoa_record.hoa_flag)
+    for rehab_record in prop.rehab:
+        for name in _REHAB_FLAG_FIELDS:
+            setattr(rehab_record, name, normalize_flag(getattr(rehab_record, name)))
+    return prop
+
+
+def decode(data: bytes) -> PropertyS:
+    """Decode one JSON property object."""
+    return _postprocess(DECODER.decode(data))
+
+
+def convert(record: dict) -> PropertyS:
+    """Convert one already-parsed property dict."""
+    return _postprocess(msgspec.convert(record, PropertyS, strict=False))
+
+
+def decode_list(data: bytes) -> List[PropertyS]:
+    """Decode a JSON array of property objects in one call."""
+    return [_postprocess(prop) for prop in LIST_DECODER.decode(data)]
+
+
+def convert_list(records: List[dict]) -> List[PropertyS]:
+    """Convert a list of already-parsed property dicts in one call."""
+    return [_postprocess(prop) for prop in msgspec.convert(records, List[PropertyS], strict=False)]
+
+
+def _wrap(model: type, struct: msgspec.Struct):
+    # Struct field names match the model's, and every field is populated
+    values = msgspec.structs.asdict(struct)
+    return _build_instance(model, values, set(values))
+
+
+def to_model(prop: PropertyS) -> Property:
+    """Wrap a decoded struct as a Property without re-validating it."""
+    property_obj = _wrap(Property, prop)
+    values = property_obj.__dict__
+    values["valuation"] = [_wrap(ValuationRecord, record) for record in prop.valuation]
+    values["hoa"] = [_wrap(HOARecord, record) for record in prop.hoa]
+    values["rehab"] = [_wrap(RehabRecord, record) for record in prop.rehab]
+    return property_obj